@@ -10,6 +10,9 @@ from fastapi import (
 from fastapi.middleware.cors import CORSMiddleware
 import requests
 import os, shutil, logging, re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 from pathlib import Path
@@ -37,9 +40,13 @@ from langchain_community.document_loaders import (
 )
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 
+from bs4 import BeautifulSoup
+
 import validators
 import urllib.parse
 import socket
+import ipaddress
+from functools import lru_cache
 
 
 from pydantic import BaseModel
@@ -86,7 +93,7 @@ from utils.utils import get_current_user, get_admin_user
 from config import (
     AppConfig,
     ENV,
-    SRC_LOG_LEVELS,
+    RAG_LOG_LEVEL,
     UPLOAD_DIR,
     DOCS_DIR,
     RAG_TOP_K,
@@ -129,7 +136,7 @@ from config import (
 from constants import ERROR_MESSAGES
 
 log = logging.getLogger(__name__)
-log.setLevel(SRC_LOG_LEVELS["RAG"])
+log.setLevel(RAG_LOG_LEVEL)
 
 app = FastAPI()
 
@@ -714,14 +721,31 @@ def get_web_loader(url: Union[str, Sequence[str]], verify_ssl: bool = True):
     return SafeWebBaseLoader(
         url,
         verify_ssl=verify_ssl,
-        requests_per_second=RAG_WEB_SEARCH_CONCURRENT_REQUESTS,
+        requests_per_second=app.state.config.RAG_WEB_SEARCH_CONCURRENT_REQUESTS,
+        default_parser="lxml",
         continue_on_failure=True,
     )
 
 
+@lru_cache(maxsize=8192)
+def _is_valid_url(url: str) -> bool:
+    return not isinstance(validators.url(url), validators.ValidationError)
+
+
+@lru_cache(maxsize=8192)
+def _is_private_ip(ip: str) -> bool:
+    address = ipaddress.ip_address(ip)
+    return (
+        address.is_private
+        or address.is_loopback
+        or address.is_link_local
+        or address.is_reserved
+    )
+
+
 def validate_url(url: Union[str, Sequence[str]]):
     if isinstance(url, str):
-        if isinstance(validators.url(url), validators.ValidationError):
+        if not _is_valid_url(url):
             raise ValueError(ERROR_MESSAGES.INVALID_URL)
         if not ENABLE_RAG_LOCAL_WEB_FETCH:
             # Local web fetch is disabled, filter out any URLs that resolve to private IP addresses
@@ -730,12 +754,8 @@ def validate_url(url: Union[str, Sequence[str]]):
             ipv4_addresses, ipv6_addresses = resolve_hostname(parsed_url.hostname)
             # Check if any of the resolved addresses are private
             # This is technically still vulnerable to DNS rebinding attacks, as we don't control WebBaseLoader
-            for ip in ipv4_addresses:
-                if validators.ipv4(ip, private=True):
-                    raise ValueError(ERROR_MESSAGES.INVALID_URL)
-            for ip in ipv6_addresses:
-                if validators.ipv6(ip, private=True):
-                    raise ValueError(ERROR_MESSAGES.INVALID_URL)
+            if any(_is_private_ip(ip) for ip in ipv4_addresses + ipv6_addresses):
+                raise ValueError(ERROR_MESSAGES.INVALID_URL)
         return True
     elif isinstance(url, Sequence):
         return all(validate_url(u) for u in url)
@@ -743,13 +763,43 @@ def validate_url(url: Union[str, Sequence[str]]):
         return False
 
 
+# Resolved addresses are reused for a short window so that a batch of URLs on the
+# same hosts only pays for one DNS lookup per host
+RESOLVE_HOSTNAME_CACHE_TTL = 60
+RESOLVE_HOSTNAME_CACHE_SIZE = 1024
+
+_resolve_hostname_cache: dict[str, tuple[float, list[str], list[str]]] = {}
+_resolve_hostname_lock = threading.Lock()
+
+
 def resolve_hostname(hostname):
-    # Get address information
-    addr_info = socket.getaddrinfo(hostname, None)
+    now = time.monotonic()
+    with _resolve_hostname_lock:
+        cached = _resolve_hostname_cache.get(hostname)
+    if cached and cached[0] > now:
+        return cached[1], cached[2]
+
+    # Get address information, one row per address rather than one per socket type
+    addr_info = socket.getaddrinfo(
+        hostname, None, type=socket.SOCK_STREAM, proto=socket.IPPROTO_TCP
+    )
 
-    # Extract IP addresses from address information
-    ipv4_addresses = [info[4][0] for info in addr_info if info[0] == socket.AF_INET]
-    ipv6_addresses = [info[4][0] for info in addr_info if info[0] == socket.AF_INET6]
+    # Extract unique IP addresses from address information
+    ipv4_addresses = list(
+        dict.fromkeys(info[4][0] for info in addr_info if info[0] == socket.AF_INET)
+    )
+    ipv6_addresses = list(
+        dict.fromkeys(info[4][0] for info in addr_info if info[0] == socket.AF_INET6)
+    )
+
+    with _resolve_hostname_lock:
+        if len(_resolve_hostname_cache) >= RESOLVE_HOSTNAME_CACHE_SIZE:
+            _resolve_hostname_cache.clear()
+        _resolve_hostname_cache[hostname] = (
+            now + RESOLVE_HOSTNAME_CACHE_TTL,
+            ipv4_addresses,
+            ipv6_addresses,
+        )
 
     return ipv4_addresses, ipv6_addresses
 
@@ -856,8 +906,6 @@ def store_web_search(form_data: SearchForm, user=Depends(get_current_user)):
         )
     except Exception as e:
         log.exception(e)
-
-        print(e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=ERROR_MESSAGES.WEB_SEARCH_ERROR(e),
@@ -1261,31 +1309,128 @@ def reset(user=Depends(get_admin_user)) -> bool:
     return True
 
 
+class _TokenBucket:
+    """Blocking token bucket allowing `rate` acquisitions per second."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Reserve a token up front; callers that overdraw the bucket wait
+            # until their token would have been refilled
+            wait = max(0.0, (1 - self.tokens) / self.rate)
+            self.tokens -= 1
+        if wait:
+            time.sleep(wait)
+
+
+# Shared by every web loader so the request rate is enforced per host across
+# concurrent loads, not per loader instance
+_WEB_LOADER_BUCKETS: dict[str, _TokenBucket] = {}
+_WEB_LOADER_BUCKETS_LOCK = threading.Lock()
+
+
+def _get_web_loader_bucket(url: str, rate: float) -> _TokenBucket:
+    host = urllib.parse.urlparse(url).netloc
+    with _WEB_LOADER_BUCKETS_LOCK:
+        bucket = _WEB_LOADER_BUCKETS.get(host)
+        if bucket is None or bucket.rate != rate:
+            if len(_WEB_LOADER_BUCKETS) >= 1024:
+                _WEB_LOADER_BUCKETS.clear()
+            bucket = _TokenBucket(rate)
+            _WEB_LOADER_BUCKETS[host] = bucket
+    return bucket
+
+
 class SafeWebBaseLoader(WebBaseLoader):
     """WebBaseLoader with enhanced error handling for URLs."""
 
-    def lazy_load(self) -> Iterator[Document]:
-        """Lazy load text from the url(s) in web_path with error handling."""
-        for path in self.web_paths:
-            try:
-                soup = self._scrape(path, bs_kwargs=self.bs_kwargs)
-                text = soup.get_text(**self.bs_get_text_kwargs)
-
-                # Build metadata
-                metadata = {"source": path}
-                if title := soup.find("title"):
-                    metadata["title"] = title.get_text()
-                if description := soup.find("meta", attrs={"name": "description"}):
-                    metadata["description"] = description.get(
-                        "content", "No description found."
+    # Pages larger than this are skipped instead of being buffered and parsed
+    max_page_bytes: int = 5_000_000
+
+    def _scrape(
+        self,
+        url: str,
+        parser: Optional[str] = None,
+        bs_kwargs: Optional[dict] = None,
+    ) -> Any:
+        if parser is None:
+            parser = "xml" if url.endswith(".xml") else self.default_parser
+        self._check_parser(parser)
+
+        _get_web_loader_bucket(url, max(1, self.requests_per_second)).acquire()
+        html_doc = self.session.get(url, **{**self.requests_kwargs, "stream": True})
+        try:
+            if self.raise_for_status:
+                html_doc.raise_for_status()
+
+            chunks = []
+            size = 0
+            for chunk in html_doc.iter_content(chunk_size=64 * 1024):
+                size += len(chunk)
+                if size > self.max_page_bytes:
+                    raise ValueError(
+                        f"Page exceeds the maximum size of {self.max_page_bytes} bytes"
                     )
-                if html := soup.find("html"):
-                    metadata["language"] = html.get("lang", "No language found.")
+                chunks.append(chunk)
+        finally:
+            html_doc.close()
+
+        # Parse the raw bytes so the parser detects the encoding from the document
+        # itself, instead of decoding the whole page in Python first
+        return BeautifulSoup(
+            b"".join(chunks),
+            parser,
+            from_encoding=self.encoding,
+            **(bs_kwargs or {}),
+        )
 
-                yield Document(page_content=text, metadata=metadata)
-            except Exception as e:
-                # Log the error and continue with the next URL
-                log.error(f"Error loading {path}: {e}")
+    def lazy_load(self) -> Iterator[Document]:
+        """Lazy load text from the url(s) in web_path with error handling.
+
+        Pages are fetched concurrently, with at most `requests_per_second` requests
+        in flight and each host limited to `requests_per_second` requests per second
+        across all loaders. Documents are yielded in completion order.
+        """
+        with ThreadPoolExecutor(
+            max_workers=max(1, int(self.requests_per_second))
+        ) as executor:
+            futures = {
+                executor.submit(self._scrape, path, bs_kwargs=self.bs_kwargs): path
+                for path in self.web_paths
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    soup = future.result()
+
+                    # Look up metadata in <head> and text in <body> so that each is
+                    # a walk over its own subtree rather than over the whole page
+                    head = soup.head or soup
+                    text = (soup.body or soup).get_text(**self.bs_get_text_kwargs)
+
+                    # Build metadata
+                    metadata = {"source": path}
+                    if title := head.find("title"):
+                        metadata["title"] = title.get_text()
+                    if description := head.find("meta", attrs={"name": "description"}):
+                        metadata["description"] = description.get(
+                            "content", "No description found."
+                        )
+                    if html := soup.html:
+                        metadata["language"] = html.get("lang", "No language found.")
+
+                    yield Document(page_content=text, metadata=metadata)
+                except Exception as e:
+                    # Log the error and continue with the next URL
+                    log.error(f"Error loading {path}: {e}")
 
 
 if ENV == "dev":
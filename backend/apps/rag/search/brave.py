@@ -1,12 +1,11 @@
 import logging
+import orjson
 
-import requests
-
-from apps.rag.search.main import SearchResult
-from config import SRC_LOG_LEVELS
+from apps.rag.search.main import SEARCH_SESSION, SearchResult
+from config import RAG_LOG_LEVEL
 
 log = logging.getLogger(__name__)
-log.setLevel(SRC_LOG_LEVELS["RAG"])
+log.setLevel(RAG_LOG_LEVEL)
 
 
 def search_brave(api_key: str, query: str, count: int) -> list[SearchResult]:
@@ -24,10 +23,10 @@ def search_brave(api_key: str, query: str, count: int) -> list[SearchResult]:
     }
     params = {"q": query, "count": count}
 
-    response = requests.get(url, headers=headers, params=params)
+    response = SEARCH_SESSION.get(url, headers=headers, params=params)
     response.raise_for_status()
 
-    json_response = response.json()
+    json_response = orjson.loads(response.content)
     results = json_response.get("web", {}).get("results", [])
     return [
         SearchResult(
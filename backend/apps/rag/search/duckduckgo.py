@@ -2,10 +2,10 @@ import logging
 
 from apps.rag.search.main import SearchResult
 from duckduckgo_search import DDGS
-from config import SRC_LOG_LEVELS
+from config import RAG_LOG_LEVEL
 
 log = logging.getLogger(__name__)
-log.setLevel(SRC_LOG_LEVELS["RAG"])
+log.setLevel(RAG_LOG_LEVEL)
 
 
 def search_duckduckgo(query: str, count: int) -> list[SearchResult]:
@@ -41,6 +41,6 @@ def search_duckduckgo(query: str, count: int) -> list[SearchResult]:
                 snippet=result.get("body"),
             )
         )
-    print(results)
+    log.debug(f"duckduckgo results: {len(results)}")
     # Return the list of search results
     return results
@@ -1,13 +1,12 @@
 import json
 import logging
+import orjson
 
-import requests
-
-from apps.rag.search.main import SearchResult
-from config import SRC_LOG_LEVELS
+from apps.rag.search.main import SEARCH_SESSION, SearchResult
+from config import RAG_LOG_LEVEL
 
 log = logging.getLogger(__name__)
-log.setLevel(SRC_LOG_LEVELS["RAG"])
+log.setLevel(RAG_LOG_LEVEL)
 
 
 def search_google_pse(
@@ -30,10 +29,10 @@ def search_google_pse(
         "num": count,
     }
 
-    response = requests.request("GET", url, headers=headers, params=params)
+    response = SEARCH_SESSION.request("GET", url, headers=headers, params=params)
     response.raise_for_status()
 
-    json_response = response.json()
+    json_response = orjson.loads(response.content)
     results = json_response.get("items", [])
     return [
         SearchResult(
@@ -41,5 +40,5 @@ def search_google_pse(
             title=result.get("title"),
             snippet=result.get("snippet"),
         )
-        for result in results
+        for result in results[:count]
     ]
@@ -1,9 +1,21 @@
+from http.cookiejar import DefaultCookiePolicy
 from typing import Optional
 
+import requests
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
 
 
 class SearchResult(BaseModel):
     link: str
     title: Optional[str]
     snippet: Optional[str]
+
+
+# Shared by the search providers so that repeated searches reuse pooled
+# connections instead of paying a new TCP/TLS handshake per query
+SEARCH_SESSION = requests.Session()
+SEARCH_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+SEARCH_SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+# Only the connections are shared; don't carry provider cookies across users
+SEARCH_SESSION.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
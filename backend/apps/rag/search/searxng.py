@@ -1,13 +1,14 @@
+import heapq
 import logging
-import requests
+import orjson
 
 from typing import List
 
-from apps.rag.search.main import SearchResult
-from config import SRC_LOG_LEVELS
+from apps.rag.search.main import SEARCH_SESSION, SearchResult
+from config import RAG_LOG_LEVEL
 
 log = logging.getLogger(__name__)
-log.setLevel(SRC_LOG_LEVELS["RAG"])
+log.setLevel(RAG_LOG_LEVEL)
 
 
 def search_searxng(
@@ -61,7 +62,7 @@ def search_searxng(
 
     log.debug(f"searching {query_url}")
 
-    response = requests.get(
+    response = SEARCH_SESSION.get(
         query_url,
         headers={
             "User-Agent": "Open WebUI (https://github.com/open-webui/open-webui) RAG Bot",
@@ -75,12 +76,12 @@ def search_searxng(
 
     response.raise_for_status()  # Raise an exception for HTTP errors.
 
-    json_response = response.json()
+    json_response = orjson.loads(response.content)
     results = json_response.get("results", [])
-    sorted_results = sorted(results, key=lambda x: x.get("score", 0), reverse=True)
+    sorted_results = heapq.nlargest(count, results, key=lambda x: x.get("score", 0))
     return [
         SearchResult(
             link=result["url"], title=result.get("title"), snippet=result.get("content")
         )
-        for result in sorted_results[:count]
+        for result in sorted_results
     ]
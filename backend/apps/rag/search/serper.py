@@ -1,13 +1,13 @@
+import heapq
 import json
 import logging
+import orjson
 
-import requests
-
-from apps.rag.search.main import SearchResult
-from config import SRC_LOG_LEVELS
+from apps.rag.search.main import SEARCH_SESSION, SearchResult
+from config import RAG_LOG_LEVEL
 
 log = logging.getLogger(__name__)
-log.setLevel(SRC_LOG_LEVELS["RAG"])
+log.setLevel(RAG_LOG_LEVEL)
 
 
 def search_serper(api_key: str, query: str, count: int) -> list[SearchResult]:
@@ -22,12 +22,12 @@ def search_serper(api_key: str, query: str, count: int) -> list[SearchResult]:
     payload = json.dumps({"q": query})
     headers = {"X-API-KEY": api_key, "Content-Type": "application/json"}
 
-    response = requests.request("POST", url, headers=headers, data=payload)
+    response = SEARCH_SESSION.request("POST", url, headers=headers, data=payload)
     response.raise_for_status()
 
-    json_response = response.json()
-    results = sorted(
-        json_response.get("organic", []), key=lambda x: x.get("position", 0)
+    json_response = orjson.loads(response.content)
+    results = heapq.nsmallest(
+        count, json_response.get("organic", []), key=lambda x: x.get("position", 0)
     )
     return [
         SearchResult(
@@ -35,5 +35,5 @@ def search_serper(api_key: str, query: str, count: int) -> list[SearchResult]:
             title=result.get("title"),
             snippet=result.get("description"),
         )
-        for result in results[:count]
+        for result in results
     ]
@@ -1,14 +1,15 @@
+import heapq
 import json
 import logging
+import orjson
 
-import requests
 from urllib.parse import urlencode
 
-from apps.rag.search.main import SearchResult
-from config import SRC_LOG_LEVELS
+from apps.rag.search.main import SEARCH_SESSION, SearchResult
+from config import RAG_LOG_LEVEL
 
 log = logging.getLogger(__name__)
-log.setLevel(SRC_LOG_LEVELS["RAG"])
+log.setLevel(RAG_LOG_LEVEL)
 
 
 def search_serply(
@@ -48,14 +49,14 @@ def search_serply(
         "X-Proxy-Location": proxy_location,
     }
 
-    response = requests.request("GET", url, headers=headers)
+    response = SEARCH_SESSION.request("GET", url, headers=headers)
     response.raise_for_status()
 
-    json_response = response.json()
+    json_response = orjson.loads(response.content)
     log.info(f"results from serply search: {json_response}")
 
-    results = sorted(
-        json_response.get("results", []), key=lambda x: x.get("realPosition", 0)
+    results = heapq.nsmallest(
+        count, json_response.get("results", []), key=lambda x: x.get("realPosition", 0)
     )
 
     return [
@@ -64,5 +65,5 @@ def search_serply(
             title=result.get("title"),
             snippet=result.get("description"),
         )
-        for result in results[:count]
+        for result in results
     ]
@@ -1,13 +1,13 @@
+import heapq
 import json
 import logging
+import orjson
 
-import requests
-
-from apps.rag.search.main import SearchResult
-from config import SRC_LOG_LEVELS
+from apps.rag.search.main import SEARCH_SESSION, SearchResult
+from config import RAG_LOG_LEVEL
 
 log = logging.getLogger(__name__)
-log.setLevel(SRC_LOG_LEVELS["RAG"])
+log.setLevel(RAG_LOG_LEVEL)
 
 
 def search_serpstack(
@@ -28,16 +28,18 @@ def search_serpstack(
         "query": query,
     }
 
-    response = requests.request("POST", url, headers=headers, params=params)
+    response = SEARCH_SESSION.request("POST", url, headers=headers, params=params)
     response.raise_for_status()
 
-    json_response = response.json()
-    results = sorted(
-        json_response.get("organic_results", []), key=lambda x: x.get("position", 0)
+    json_response = orjson.loads(response.content)
+    results = heapq.nsmallest(
+        count,
+        json_response.get("organic_results", []),
+        key=lambda x: x.get("position", 0),
     )
     return [
         SearchResult(
             link=result["url"], title=result.get("title"), snippet=result.get("snippet")
         )
-        for result in results[:count]
+        for result in results
     ]
@@ -1,12 +1,11 @@
 import logging
+import orjson
 
-import requests
-
-from apps.rag.search.main import SearchResult
-from config import SRC_LOG_LEVELS
+from apps.rag.search.main import SEARCH_SESSION, SearchResult
+from config import RAG_LOG_LEVEL
 
 log = logging.getLogger(__name__)
-log.setLevel(SRC_LOG_LEVELS["RAG"])
+log.setLevel(RAG_LOG_LEVEL)
 
 
 def search_tavily(api_key: str, query: str, count: int) -> list[SearchResult]:
@@ -22,10 +21,10 @@ def search_tavily(api_key: str, query: str, count: int) -> list[SearchResult]:
     url = "https://api.tavily.com/search"
     data = {"query": query, "api_key": api_key}
 
-    response = requests.post(url, json=data)
+    response = SEARCH_SESSION.post(url, json=data)
     response.raise_for_status()
 
-    json_response = response.json()
+    json_response = orjson.loads(response.content)
 
     raw_search_results = json_response.get("results", [])
 
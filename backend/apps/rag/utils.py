@@ -1,7 +1,10 @@
 import os
 import logging
+import orjson
 import requests
 
+from concurrent.futures import ThreadPoolExecutor
+
 from typing import List, Union
 
 from apps.ollama.main import (
@@ -21,10 +24,10 @@ from langchain.retrievers import (
 from typing import Optional
 
 from utils.misc import get_last_user_message, add_or_update_system_message
-from config import SRC_LOG_LEVELS, CHROMA_CLIENT
+from config import RAG_LOG_LEVEL, CHROMA_CLIENT
 
 log = logging.getLogger(__name__)
-log.setLevel(SRC_LOG_LEVELS["RAG"])
+log.setLevel(RAG_LOG_LEVEL)
 
 
 def query_doc(
@@ -193,6 +196,10 @@ def rag_template(template: str, context: str, query: str):
     return template
 
 
+# Maximum number of concurrent requests when embedding a list with Ollama
+OLLAMA_EMBEDDING_CONCURRENCY = 8
+
+
 def get_embedding_function(
     embedding_engine,
     embedding_model,
@@ -229,7 +236,11 @@ def get_embedding_function(
                         embeddings.extend(f(query[i : i + batch_size]))
                     return embeddings
                 else:
-                    return [f(q) for q in query]
+                    # Ollama embeds one prompt per request, so overlap the requests
+                    with ThreadPoolExecutor(
+                        max_workers=OLLAMA_EMBEDDING_CONCURRENCY
+                    ) as executor:
+                        return list(executor.map(f, query))
             else:
                 return f(query)
 
@@ -385,13 +396,13 @@ def generate_openai_batch_embeddings(
             json={"input": texts, "model": model},
         )
         r.raise_for_status()
-        data = r.json()
+        data = orjson.loads(r.content)
         if "data" in data:
             return [elem["embedding"] for elem in data["data"]]
         else:
             raise "Something went wrong :/"
     except Exception as e:
-        print(e)
+        log.exception(e)
         return None
 
 
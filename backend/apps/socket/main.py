@@ -35,7 +35,7 @@ async def connect(sid, environ, auth):
 
             print(f"user {user.name}({user.id}) connected with session ID {sid}")
 
-            await sio.emit("user-count", {"count": len(set(USER_POOL))})
+            await sio.emit("user-count", {"count": len(USER_POOL)})
             await sio.emit("usage", {"models": get_models_in_use()})
 
 
@@ -61,12 +61,12 @@ async def user_join(sid, data):
 
             print(f"user {user.name}({user.id}) connected with session ID {sid}")
 
-            await sio.emit("user-count", {"count": len(set(USER_POOL))})
+            await sio.emit("user-count", {"count": len(USER_POOL)})
 
 
 @sio.on("user-count")
 async def user_count(sid):
-    await sio.emit("user-count", {"count": len(set(USER_POOL))})
+    await sio.emit("user-count", {"count": len(USER_POOL)})
 
 
 def get_models_in_use():
@@ -90,8 +90,9 @@ async def usage(sid, data):
     # Store the new usage data and task
 
     if model_id in USAGE_POOL:
-        USAGE_POOL[model_id]["sids"].append(sid)
-        USAGE_POOL[model_id]["sids"] = list(set(USAGE_POOL[model_id]["sids"]))
+        # Keep the sid list unique without rebuilding it on every event
+        if sid not in USAGE_POOL[model_id]["sids"]:
+            USAGE_POOL[model_id]["sids"].append(sid)
 
     else:
         USAGE_POOL[model_id] = {"sids": [sid]}
@@ -111,7 +112,6 @@ async def remove_after_timeout(sid, model_id):
         if model_id in USAGE_POOL:
             print(USAGE_POOL[model_id]["sids"])
             USAGE_POOL[model_id]["sids"].remove(sid)
-            USAGE_POOL[model_id]["sids"] = list(set(USAGE_POOL[model_id]["sids"]))
 
             if len(USAGE_POOL[model_id]["sids"]) == 0:
                 del USAGE_POOL[model_id]
@@ -177,6 +177,22 @@ class AuthsTable:
         except:
             return False
 
+    def update_auth_by_id(
+        self, id: str, email: str, password: Optional[str] = None
+    ) -> bool:
+        try:
+            # Update the email and, when given, the password in one statement
+            fields = {"email": email}
+            if password:
+                fields["password"] = password
+
+            query = Auth.update(**fields).where(Auth.id == id)
+            result = query.execute()
+
+            return True if result == 1 else False
+        except:
+            return False
+
     def delete_auth_by_id(self, id: str) -> bool:
         try:
             # Delete User
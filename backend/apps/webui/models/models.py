@@ -141,7 +141,7 @@ class ModelsTable:
             else:
                 return None
         except Exception as e:
-            print(e)
+            log.exception(e)
             return None
 
     def get_all_models(self) -> List[ModelModel]:
@@ -160,10 +160,14 @@ class ModelsTable:
             query = Model.update(**model.model_dump()).where(Model.id == id)
             query.execute()
 
-            model = Model.get(Model.id == id)
+            # Don't rely on the rowcount: MySQL reports changed rows, not matched
+            model = Model.get_or_none(Model.id == id)
+            if model is None:
+                return None
+
             return ModelModel(**model_to_dict(model))
         except Exception as e:
-            print(e)
+            log.exception(e)
 
             return None
 
@@ -5,6 +5,7 @@ from typing import List, Union, Optional
 
 from fastapi import APIRouter
 from pydantic import BaseModel
+import asyncio
 import logging
 
 from apps.webui.models.memories import Memories, MemoryModel
@@ -125,17 +126,33 @@ async def query_memory(
 async def reset_memory_from_vector_db(
     request: Request, user=Depends(get_verified_user)
 ):
-    CHROMA_CLIENT.delete_collection(f"user-memory-{user.id}")
+    memories = Memories.get_memories_by_user_id(user.id)
+    if not memories:
+        # Still drop the collection so stale vectors of deleted memories go away
+        try:
+            CHROMA_CLIENT.delete_collection(f"user-memory-{user.id}")
+        except Exception as e:
+            log.error(e)
+        return True
+
+    # Embed all memories in one batch, off the event loop, before touching the
+    # collection so it is only briefly empty
+    documents = [memory.content for memory in memories]
+    embeddings = await asyncio.to_thread(
+        request.app.state.EMBEDDING_FUNCTION, documents
+    )
+
+    try:
+        CHROMA_CLIENT.delete_collection(f"user-memory-{user.id}")
+    except Exception as e:
+        log.error(e)
     collection = CHROMA_CLIENT.get_or_create_collection(name=f"user-memory-{user.id}")
 
-    memories = Memories.get_memories_by_user_id(user.id)
-    for memory in memories:
-        memory_embedding = request.app.state.EMBEDDING_FUNCTION(memory.content)
-        collection.upsert(
-            documents=[memory.content],
-            ids=[memory.id],
-            embeddings=[memory_embedding],
-        )
+    collection.upsert(
+        documents=documents,
+        ids=[memory.id for memory in memories],
+        embeddings=embeddings,
+    )
     return True
 
 
@@ -1,25 +1,37 @@
-from fastapi import Depends, FastAPI, HTTPException, status, Request
+from fastapi import Depends, FastAPI, HTTPException, status, Request, Response
 from datetime import datetime, timedelta
 from typing import List, Union, Optional
 
 from fastapi import APIRouter
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
 import json
 from apps.webui.models.models import Models, ModelModel, ModelForm, ModelResponse
 
 from utils.utils import get_verified_user, get_admin_user
 from constants import ERROR_MESSAGES
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 ###########################
 # getModels
 ###########################
 
 
+_MODELS_ADAPTER = TypeAdapter(List[ModelModel])
+_MODEL_RESPONSE_FIELDS = {"__all__": set(ModelResponse.model_fields)}
+
+
 @router.get("/", response_model=List[ModelResponse])
 async def get_models(user=Depends(get_verified_user)):
-    return Models.get_all_models()
+    # Encode the rows straight to JSON, keeping only the ModelResponse fields;
+    # this is the sole serialization path, bypassing the router's ORJSONResponse
+    return Response(
+        content=_MODELS_ADAPTER.dump_json(
+            Models.get_all_models(), include=_MODEL_RESPONSE_FIELDS
+        ),
+        media_type="application/json",
+    )
 
 
 ############################
@@ -75,9 +87,10 @@ async def get_model_by_id(id: str, user=Depends(get_verified_user)):
 async def update_model_by_id(
     request: Request, id: str, form_data: ModelForm, user=Depends(get_admin_user)
 ):
-    model = Models.get_model_by_id(id)
+    # Updating reports a missing model directly, so there is no need to look it up
+    # beforehand
+    model = Models.update_model_by_id(id, form_data)
     if model:
-        model = Models.update_model_by_id(id, form_data)
         return model
     else:
         if form_data.id in request.app.state.MODELS:
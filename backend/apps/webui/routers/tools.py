@@ -5,6 +5,7 @@ from typing import List, Union, Optional
 from fastapi import APIRouter
 from pydantic import BaseModel
 import json
+import logging
 
 from apps.webui.models.tools import Tools, ToolForm, ToolModel, ToolResponse
 from apps.webui.utils import load_toolkit_module_by_id
@@ -16,7 +17,10 @@ from constants import ERROR_MESSAGES
 from importlib import util
 import os
 
-from config import DATA_DIR
+from config import DATA_DIR, SRC_LOG_LEVELS
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["MODELS"])
 
 
 TOOLS_DIR = f"{DATA_DIR}/tools"
@@ -87,7 +91,7 @@ async def create_new_toolkit(
                     detail=ERROR_MESSAGES.DEFAULT("Error creating toolkit"),
                 )
         except Exception as e:
-            print(e)
+            log.exception(e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=ERROR_MESSAGES.DEFAULT(e),
@@ -144,7 +148,7 @@ async def update_toolkit_by_id(
             "specs": specs,
         }
 
-        print(updated)
+        log.debug(f"updating toolkit {id}")
         toolkit = Tools.update_tool_by_id(id, updated)
 
         if toolkit:
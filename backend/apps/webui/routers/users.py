@@ -4,7 +4,8 @@ from datetime import datetime, timedelta
 from typing import List, Union, Optional
 
 from fastapi import APIRouter
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
 import time
 import uuid
 import logging
@@ -32,16 +33,24 @@ from config import SRC_LOG_LEVELS
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MODELS"])
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 ############################
 # GetUsers
 ############################
 
 
+_USERS_ADAPTER = TypeAdapter(List[UserModel])
+
+
 @router.get("/", response_model=List[UserModel])
 async def get_users(skip: int = 0, limit: int = 50, user=Depends(get_admin_user)):
-    return Users.get_users(skip, limit)
+    # Encode the list straight to JSON without re-validating each user; this
+    # is the sole serialization path, bypassing the router's ORJSONResponse
+    return Response(
+        content=_USERS_ADAPTER.dump_json(Users.get_users(skip, limit)),
+        media_type="application/json",
+    )
 
 
 ############################
@@ -86,14 +95,8 @@ async def update_user_role(form_data: UserRoleUpdateForm, user=Depends(get_admin
 
 @router.get("/user/settings", response_model=Optional[UserSettings])
 async def get_user_settings_by_session_user(user=Depends(get_verified_user)):
-    user = Users.get_user_by_id(user.id)
-    if user:
-        return user.settings
-    else:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=ERROR_MESSAGES.USER_NOT_FOUND,
-        )
+    # The session user was just loaded from the database by get_current_user
+    return user.settings
 
 
 ############################
@@ -122,14 +125,8 @@ async def update_user_settings_by_session_user(
 
 @router.get("/user/info", response_model=Optional[dict])
 async def get_user_info_by_session_user(user=Depends(get_verified_user)):
-    user = Users.get_user_by_id(user.id)
-    if user:
-        return user.info
-    else:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=ERROR_MESSAGES.USER_NOT_FOUND,
-        )
+    # The session user was just loaded from the database by get_current_user
+    return user.info
 
 
 ############################
@@ -218,12 +215,12 @@ async def update_user_by_id(
                     detail=ERROR_MESSAGES.EMAIL_TAKEN,
                 )
 
+        hashed = None
         if form_data.password:
             hashed = get_password_hash(form_data.password)
             log.debug(f"hashed: {hashed}")
-            Auths.update_user_password_by_id(user_id, hashed)
 
-        Auths.update_email_by_id(user_id, form_data.email.lower())
+        Auths.update_auth_by_id(user_id, form_data.email.lower(), hashed)
         updated_user = Users.update_user_by_id(
             user_id,
             {
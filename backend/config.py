@@ -79,6 +79,9 @@ for source in log_sources:
 
 log.setLevel(SRC_LOG_LEVELS["CONFIG"])
 
+# Resolved once for the RAG modules, which all share this level
+RAG_LOG_LEVEL = SRC_LOG_LEVELS["RAG"]
+
 WEBUI_NAME = os.environ.get("WEBUI_NAME", "Open WebUI")
 if WEBUI_NAME != "Open WebUI":
     WEBUI_NAME += " (Open WebUI)"
@@ -8,10 +8,12 @@ from typing import Union, Optional
 from constants import ERROR_MESSAGES
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
+from functools import lru_cache
 import requests
 import jwt
 import uuid
 import logging
+import time
 import config
 
 logging.getLogger("passlib").setLevel(logging.ERROR)
@@ -49,7 +51,8 @@ def create_token(data: dict, expires_delta: Union[timedelta, None] = None) -> st
     return encoded_jwt
 
 
-def decode_token(token: str) -> Optional[dict]:
+@lru_cache(maxsize=4096)
+def _decode_token(token: str) -> Optional[dict]:
     try:
         decoded = jwt.decode(token, SESSION_SECRET, algorithms=[ALGORITHM])
         return decoded
@@ -57,6 +60,19 @@ def decode_token(token: str) -> Optional[dict]:
         return None
 
 
+def decode_token(token: str) -> Optional[dict]:
+    # The same token is presented on every request, so reuse the verified
+    # payload but still reject it once its expiry has passed
+    decoded = _decode_token(token)
+    if decoded is None:
+        return None
+
+    if "exp" in decoded and decoded["exp"] <= time.time():
+        return None
+
+    return decoded.copy()
+
+
 def extract_token_from_auth_header(auth_header: str):
     return auth_header[len("Bearer ") :]
 